@@ -1,19 +1,21 @@
-FUNCTIONS_TO_SKIP = [
-    "main",
-    "init",
-    "setup",
-    "teardown",
-    "middleware",
-    "Body",
-    "Header",
-    "Query",
-    "Path",
-    "Cookie",
-    "Form",
-    "File",
-    "UploadFile",
-    "Depends",
-    "HTTPException",
-    "Request",
-    "Response",
-]
+FUNCTIONS_TO_SKIP = frozenset(
+    {
+        "main",
+        "init",
+        "setup",
+        "teardown",
+        "middleware",
+        "Body",
+        "Header",
+        "Query",
+        "Path",
+        "Cookie",
+        "Form",
+        "File",
+        "UploadFile",
+        "Depends",
+        "HTTPException",
+        "Request",
+        "Response",
+    }
+)
@@ -28,8 +28,7 @@ def main():
     # router.set_custom_tag("routes/users/[:id].py", "user-m2")
 
     # Re-scan routes to apply custom tags
-    router._routes.clear()  # Clear existing routes
-    router.scan_routes()  # Re-scan with custom tags
+    router.scan_routes()
 
     routes = router.get_routes()
     for route in sorted(routes, key=lambda x: x["pattern"]):
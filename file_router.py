@@ -4,14 +4,59 @@ This module implements a file-based router for FastAPI, allowing dynamic route r
 It supports static, dynamic, typed, slug, and catch-all routes, along with custom tagging functionality.
 """
 
+import os
 import inspect
 import logging
+import functools
+import itertools
 import importlib.util
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Callable
-from fastapi import FastAPI
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Any, Callable
+from fastapi import APIRouter, FastAPI, routing as fastapi_routing
 
 from constants import FUNCTIONS_TO_SKIP
+from orjson_response import ORJSONResponse
+
+__all__ = ["FileBasedRouter", "file_router"]
+
+_LOGGER = logging.getLogger("uvicorn.error")
+
+# Newer FastAPI versions keep an included router as a single lazy entry; older
+# ones rebuild every route on include_router, so routes are added directly there
+_LAZY_INCLUDE_ROUTER = hasattr(fastapi_routing, "_IncludedRouter")
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_dynamic_segment(segment: str) -> Tuple[str, str, bool]:
+    """
+    Parse dynamic route segments.
+    Returns: (param_name, param_type, is_catch_all)
+
+    Supported formats:
+    - [id] -> ('id', 'str', False)
+    - [id:int] -> ('id', 'int', False)
+    - [slug:] -> ('slug', 'str', False)
+    - [...rest] -> ('rest', 'str', True)
+    """
+    # Fast reject for static segments
+    if not segment or segment[0] != "[" or segment[-1] != "]":
+        return None, None, False
+
+    inner = segment[1:-1]
+
+    # Catch-all route [...rest]
+    if inner.startswith("..."):
+        param_name = inner[3:]
+        return param_name, "str", True
+
+    # Typed parameter [id:int] or slug parameter [slug:]
+    name_and_type = inner.split(":", 1)
+    if len(name_and_type) == 1:
+        return inner, "str", False
+
+    param_name, param_type = name_and_type
+    return param_name, param_type or "str", False
 
 
 class FileBasedRouter:
@@ -27,11 +72,30 @@ class FileBasedRouter:
     - Providing access to registered routes and the FastAPI app instance
     """
 
+    _HTTP_METHODS = (
+        ("GET", "get"),
+        ("POST", "post"),
+        ("PUT", "put"),
+        ("DELETE", "delete"),
+        ("PATCH", "patch"),
+        ("HEAD", "head"),
+        ("OPTIONS", "options"),
+    )
+    _HTTP_METHOD_SET = frozenset(name for _, name in _HTTP_METHODS)
+
     def __init__(self, routes_dir: str = "routes"):
         self.routes_dir = Path(routes_dir)
-        self.app = FastAPI()
-        self._routes: List[Dict[str, Any]] = []
+        self._app: Optional[FastAPI] = None
+        # Routes waiting to be added to the app, keyed by route file path
+        self._pending_routes: Dict[str, List[Dict[str, Any]]] = {}
+        self._static_routes: Dict[str, Mapping[str, Any]] = {}
+        self._dynamic_routes: Dict[str, Mapping[str, Any]] = {}
         self._custom_tags: Dict[str, str] = {}
+        self._dir_tag_cache: Dict[Path, Optional[str]] = {}
+        self._routes_root_parent = self.routes_dir.parent
+        # Parsed (pattern, params) per relative route path, from the last scan
+        self._route_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._mod_counter = itertools.count()
 
     def _generate_tag_from_route(self, route_pattern: str, file_path: Path) -> str:
         """
@@ -50,13 +114,9 @@ class FileBasedRouter:
             return self._custom_tags[file_path_str]
 
         # Check for directory-level custom tag override
-        # Goes up the directory tree to find a matching custom tag
-        current_path = file_path.parent
-        while current_path != self.routes_dir.parent:
-            dir_path_str = str(current_path)
-            if dir_path_str in self._custom_tags:
-                return self._custom_tags[dir_path_str]
-            current_path = current_path.parent
+        dir_tag = self._dir_tag(file_path.parent)
+        if dir_tag is not None:
+            return dir_tag
 
         # Extract first path segment
         parts = [
@@ -70,6 +130,26 @@ class FileBasedRouter:
         else:
             return "default"
 
+    def _dir_tag(self, directory: Path) -> Optional[str]:
+        """
+        Find the closest directory-level custom tag for a directory.
+
+        Goes up the directory tree until the routes directory's parent,
+        memoizing the result for every directory visited.
+        """
+        if directory == self._routes_root_parent or directory == directory.parent:
+            return None
+
+        if directory in self._dir_tag_cache:
+            return self._dir_tag_cache[directory]
+
+        tag = self._custom_tags.get(str(directory))
+        if tag is None:
+            tag = self._dir_tag(directory.parent)
+
+        self._dir_tag_cache[directory] = tag
+        return tag
+
     def set_custom_tag(self, path: str, tag: str):
         """
         Set a custom tag for a specific route file or directory.
@@ -79,59 +159,36 @@ class FileBasedRouter:
         - router.set_custom_tag("routes/users", "user-management")      # All files in directory
         """
         self._custom_tags[path] = tag
+        self._dir_tag_cache.clear()
 
     def _parse_dynamic_segment(self, segment: str) -> Tuple[str, str, bool]:
-        """
-        Parse dynamic route segments.
-        Returns: (param_name, param_type, is_catch_all)
-
-        Supported formats:
-        - [id] -> ('id', 'str', False)
-        - [id:int] -> ('id', 'int', False)
-        - [slug:] -> ('slug', 'str', False)
-        - [...rest] -> ('rest', 'str', True)
-        """
-        if not segment.startswith("[") or not segment.endswith("]"):
-            return None, None, False
-
-        inner = segment[1:-1]
-
-        # Catch-all route [...rest]
-        if inner.startswith("..."):
-            param_name = inner[3:]
-            return param_name, "str", True
-
-        # Typed parameter [id:int] or slug parameter [slug:]
-        if ":" in inner:
-            param_name, param_type = inner.split(":", 1)
-            if param_type == "":
-                param_type = "str"
-            return param_name, param_type, False
-
-        return inner, "str", False
+        """Parse a dynamic route segment (see the module-level helper)."""
+        return _parse_dynamic_segment(segment)
 
     def _convert_file_path_to_route(
-        self, file_path: Path
+        self, rel_path: str
     ) -> Tuple[str, Dict[str, Any]]:
         """
-        Convert file path to FastAPI route pattern and extract parameters.
+        Convert a file path relative to the routes directory ("/"-separated)
+        to a FastAPI route pattern and extract parameters.
 
         Examples:
-        - routes/users/index.py -> /users
-        - routes/users/[id].py -> /users/{id}
-        - routes/posts/[slug:].py -> /posts/{slug}
-        - routes/files/[...path].py -> /files/{path:path}
+        - users/index.py -> /users
+        - users/[id].py -> /users/{id}
+        - posts/[slug:].py -> /posts/{slug}
+        - files/[...path].py -> /files/{path:path}
         """
-        # Get relative path from routes directory
-        rel_path = file_path.relative_to(self.routes_dir)
-
-        # Remove .py extension
-        path_parts = list(rel_path.parts[:-1]) + [rel_path.stem]
+        # Remove .py extension and split into segments
+        path_parts = rel_path.rsplit(".", 1)[0].split("/")
 
         # Replace index with empty string
         if path_parts[-1] == "index":
             path_parts = path_parts[:-1]
 
+        # Static routes need no per-segment parsing
+        if not any("[" in part for part in path_parts):
+            return "/" + "/".join(path_parts), {}
+
         route_pattern = ""
         params = {}
 
@@ -161,7 +218,7 @@ class FileBasedRouter:
 
     def _load_route_module(self, file_path: Path):
         """Load a Python module from file path."""
-        module_name = f"route_{file_path.stem}_{hash(str(file_path))}"
+        module_name = f"_r{next(self._mod_counter)}_{file_path.stem}"
         spec = importlib.util.spec_from_file_location(module_name, file_path)
         if spec is None or spec.loader is None:
             return None
@@ -174,73 +231,76 @@ class FileBasedRouter:
     ):
         """Extract HTTP method handlers from a route module."""
         handlers = {}
+        module_vars = vars(module)
 
-        methods = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
-        method_names = [method.lower() for method in methods]
-
-        for method in methods:
-            handler_name = method.lower()
-            if hasattr(module, handler_name):
-                handler = getattr(module, handler_name)
-                if callable(handler):
-                    handlers[method] = handler
+        for method, handler_name in self._HTTP_METHODS:
+            handler = module_vars.get(handler_name)
+            if handler is not None and callable(handler):
+                handlers[method] = handler
 
         # Check for unrecognized function names and log a warning
-        for name in dir(module):
-            if name.startswith("_"):
-                continue
-
-            attr = getattr(module, name)
-            if callable(attr) and inspect.isfunction(attr) and name not in method_names:
-                if name not in FUNCTIONS_TO_SKIP:
-                    logger = logging.getLogger("uvicorn.error")
-                    logger.warning(
-                        "Function '%s' in %s is not a recognized HTTP method handler",
-                        name,
-                        module.__name__,
-                    )
+        for name, attr in module_vars.items():
+            if (
+                name not in self._HTTP_METHOD_SET
+                and not name.startswith("_")
+                and name not in FUNCTIONS_TO_SKIP
+                and inspect.isfunction(attr)
+                and attr.__module__ == module.__name__
+            ):
+                # Only warn about functions defined in the route module itself
+                _LOGGER.warning(
+                    "Function '%s' in %s is not a recognized HTTP method handler",
+                    name,
+                    module.__name__,
+                )
 
         return handlers
 
-    def _create_route_wrapper(self, handler: Callable, params: Dict[str, Any]):
-        """Create a wrapper function that properly handles path parameters."""
-        sig = inspect.signature(handler)
+    def _build_path_parameters(
+        self, params: Dict[str, Any]
+    ) -> List[inspect.Parameter]:
+        """Build the signature parameters for a route's path parameters."""
+        return [
+            inspect.Parameter(
+                param_name,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=int if param_info["type"] == "int" else str,
+            )
+            for param_name, param_info in params.items()
+        ]
 
+    def _create_route_wrapper(
+        self,
+        handler: Callable,
+        params: Dict[str, Any],
+        path_parameters: Optional[List[inspect.Parameter]] = None,
+    ):
+        """Create a wrapper function that properly handles path parameters."""
         if not params:
-            # create simple wrapper that preserves signature if not path parameters
-            # This allows FastAPI to handle request bodies, query params, headers, etc.
-            if inspect.iscoroutinefunction(handler):
+            # The handler's own signature already describes its request bodies,
+            # query params, headers, etc., so FastAPI can call it directly
+            return handler
 
-                async def simple_wrapper(*args, **kwargs):
-                    return await handler(*args, **kwargs)
-            else:
+        sig = inspect.signature(handler)
 
-                def simple_wrapper(*args, **kwargs):
-                    return handler(*args, **kwargs)
+        if path_parameters is None:
+            path_parameters = self._build_path_parameters(params)
 
-            # Preserve the original signature for FastAPI dependency injection
-            simple_wrapper.__signature__ = sig
-            return simple_wrapper
+        # Handler already declares every path parameter with the expected type
+        handler_params = sig.parameters
+        if all(
+            path_param.name in handler_params
+            and handler_params[path_param.name].annotation is path_param.annotation
+            and handler_params[path_param.name].default is inspect.Parameter.empty
+            for path_param in path_parameters
+        ):
+            return handler
 
-        original_params = list(sig.parameters.values())
+        original_params = list(handler_params.values())
         path_param_names = set(params.keys())
 
         # Build new signature preserving non-path parameters as-is
-        new_params = []
-
-        for param_name, param_info in params.items():
-            if param_info["type"] == "int":
-                param_type = int
-            else:
-                param_type = str
-
-            new_params.append(
-                inspect.Parameter(
-                    param_name,
-                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    annotation=param_type,
-                )
-            )
+        new_params = list(path_parameters)
 
         for param in original_params:
             if param.name not in path_param_names:
@@ -261,63 +321,155 @@ class FileBasedRouter:
 
         return param_wrapper
 
+    def _iter_py_files(self, root: str) -> Iterator[Tuple[os.DirEntry, str]]:
+        """
+        Recursively yield (entry, relative_path) for every route file under root.
+
+        Files and directories starting with "_" or "." are skipped, and symlinked
+        directories are not followed. The relative path always uses "/" as separator.
+        """
+        stack = [(root, "")]
+        while stack:
+            directory, rel_prefix = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(("_", ".")):
+                        continue
+                    # Not following symlinks avoids loops, matching Path.rglob
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{rel_prefix}{name}/"))
+                    elif name.endswith(".py") and entry.is_file():
+                        yield entry, rel_prefix + name
+
     def scan_routes(self):
         """Scan the routes directory and register all route files."""
         if not self.routes_dir.exists():
             raise FileNotFoundError(f"Routes directory '{self.routes_dir}' not found")
 
-        for file_path in self.routes_dir.rglob("*.py"):
-            if file_path.name.startswith("__"):
-                continue
+        # Only paths seen in this scan are kept, so removed files are evicted
+        previous_cache = self._route_cache
+        self._route_cache = {}
+        # Files registered in this scan; route entries for any other file are dropped
+        registered = set()
 
-            try:
-                route_pattern, params = self._convert_file_path_to_route(file_path)
+        for entry, rel_path in self._iter_py_files(str(self.routes_dir)):
+            file_path = Path(entry.path)
+            file_key = str(file_path)
 
-                module = self._load_route_module(file_path)
-                if module is None:
-                    continue
+            # The pattern depends only on the relative path, so reuse the last parse
+            cached = previous_cache.get(rel_path)
+            if cached is None:
+                cached = self._convert_file_path_to_route(rel_path)
+            self._route_cache[rel_path] = cached
+            route_pattern, params = cached
 
-                handlers = self._extract_route_handlers(module, route_pattern, params)
-
-                if not handlers:
-                    continue
+            # Route modules run arbitrary code on import, so any error skips the file
+            try:
+                module = self._load_route_module(file_path)
+            except Exception:
+                _LOGGER.exception("Error loading route %s", file_path)
+                continue
+            if module is None:
+                continue
 
-                # Register each handler
-                for method, handler in handlers.items():
-                    wrapped_handler = self._create_route_wrapper(handler, params)
+            handlers = self._extract_route_handlers(module, route_pattern, params)
 
-                    tag = self._generate_tag_from_route(route_pattern, file_path)
+            if not handlers:
+                continue
 
-                    self.app.add_api_route(
-                        route_pattern,
-                        wrapped_handler,
-                        methods=[method],
-                        name=f"{method.lower()}_{file_path.stem}",
-                        tags=[tag],
-                    )
+            tag = self._generate_tag_from_route(route_pattern, file_path)
 
-                # Store route info
-                self._routes.append(
+            # Queue each handler for registration with the app
+            try:
+                # Path parameters are identical for every handler in the file
+                path_parameters = self._build_path_parameters(params)
+                self._pending_routes[file_key] = [
                     {
-                        "pattern": route_pattern,
-                        "file_path": str(file_path),
-                        "params": params,
-                        "methods": list(handlers.keys()),
-                        "tag": tag,
+                        "path": route_pattern,
+                        "endpoint": self._create_route_wrapper(
+                            handler, params, path_parameters
+                        ),
+                        "methods": [method],
+                        "name": f"{method.lower()}_{file_path.stem}",
+                        "tags": [tag],
                     }
-                )
-
-            except Exception as e:
-                print(f"Error loading route {file_path}: {e}")
+                    for method, handler in handlers.items()
+                ]
+            except (TypeError, ValueError):
+                # inspect.signature fails on handlers it cannot introspect, and
+                # inspect.Parameter on param names that are not identifiers
+                _LOGGER.exception("Error registering route %s", file_path)
                 continue
 
-    def get_routes(self) -> List[Dict[str, Any]]:
-        """Get information about all registered routes."""
-        return self._routes.copy()
+            # Store route info as a read-only view
+            # (params is shared with the route cache, so it is exposed read-only too)
+            route_info = MappingProxyType(
+                {
+                    "pattern": route_pattern,
+                    "file_path": file_key,
+                    "params": MappingProxyType(
+                        {
+                            name: MappingProxyType(info)
+                            for name, info in params.items()
+                        }
+                    ),
+                    "methods": tuple(handlers),
+                    "tag": tag,
+                }
+            )
+            # Keyed by file path so a re-scan replaces entries instead of duplicating
+            if params:
+                self._dynamic_routes[file_key] = route_info
+            else:
+                self._static_routes[file_key] = route_info
+            registered.add(file_key)
+
+        # Drop files that were deleted or no longer load or register
+        for table in (self._static_routes, self._dynamic_routes, self._pending_routes):
+            for file_key in table.keys() - registered:
+                del table[file_key]
+
+        # Routes scanned after the app was built are registered right away
+        if self._app is not None:
+            self._register_pending_routes()
+
+    def _register_pending_routes(self):
+        """Add all queued routes to the FastAPI app in a single batch."""
+        target = APIRouter() if _LAZY_INCLUDE_ROUTER else self._app
+        for route_kwargs in self._pending_routes.values():
+            for kwargs in route_kwargs:
+                target.add_api_route(**kwargs)
+        if target is not self._app:
+            self._app.include_router(target)
+        self._pending_routes.clear()
+
+    def get_routes(self) -> Tuple[Mapping[str, Any], ...]:
+        """
+        Get information about all registered routes.
+
+        Entries, including their "params", are read-only mappings and "methods"
+        is a tuple; use dict(...) or list(...) for a mutable copy.
+        """
+        return (*self._static_routes.values(), *self._dynamic_routes.values())
 
     def get_app(self) -> FastAPI:
-        """Get the FastAPI application instance."""
-        return self.app
+        """
+        Get the FastAPI application instance.
+
+        The app is created on first access, with ORJSONResponse as its default
+        response class, and all scanned routes are registered with it at that point.
+        """
+        if self._app is None:
+            self._app = FastAPI(default_response_class=ORJSONResponse)
+        if self._pending_routes:
+            self._register_pending_routes()
+        return self._app
+
+    @property
+    def app(self) -> FastAPI:
+        """The FastAPI application instance (see get_app)."""
+        return self.get_app()
 
 
 def file_router(routes_dir: str = "routes") -> FileBasedRouter:
@@ -12,20 +12,30 @@ Usage:
     python server.py
 
 Then visit http://localhost:8000 to see the demo in action.
+Set ROUTER_BANNER=0 to skip the startup banner and ENABLE_CORS=1 to allow
+cross-origin requests.
 """
 
+import os
+import sys
+
 import uvicorn
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from file_router import file_router
 
 # Create the app at module level for uvicorn reload
 router = file_router("routes")
 app = router.get_app()
 
+# Middleware is set up at import time too: uvicorn's reloader imports main:app
+# in a fresh process where main() never runs
+# Level 4 balances compression ratio and CPU for JSON
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=4)
 
-def main():
-    # Add some middleware for better demo experience
-    from fastapi.middleware.cors import CORSMiddleware
-
+# CORS is opt-in; added last so it is the outermost middleware and
+# answers preflight requests before anything else runs
+if os.getenv("ENABLE_CORS") == "1":
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -34,30 +44,54 @@ def main():
         allow_headers=["*"],
     )
 
-    # Print route information
-    print("\n🚀 File-Based Router Demo Server")
-    print("=" * 50)
-    print("Server starting at: http://localhost:8000")
-    print("Documentation: http://localhost:8000/docs")
-    print("Routes directory: routes/")
-    print("\nRegistered routes:")
 
-    routes = router.get_routes()
-    for route in sorted(routes, key=lambda x: x["pattern"]):
-        methods = ", ".join(route["methods"])
-        print(f"  {route['pattern']:<30} [{methods}] -> {route['file_path']}")
+def main():
+    # Print route information (set ROUTER_BANNER=0 to skip, e.g. in production)
+    if os.getenv("ROUTER_BANNER", "1") == "1":
+        lines = [
+            "",
+            "🚀 File-Based Router Demo Server",
+            "=" * 50,
+            "Server starting at: http://localhost:8000",
+            "Documentation: http://localhost:8000/docs",
+            "Routes directory: routes/",
+            "",
+            "Registered routes:",
+        ]
+
+        routes = router.get_routes()
+        for route in sorted(routes, key=lambda x: x["pattern"]):
+            methods = ", ".join(route["methods"])
+            lines.append(
+                f"  {route['pattern']:<30} [{methods}] -> {route['file_path']}"
+            )
+
+        lines += [
+            "",
+            "Example requests to try:",
+            "  curl http://localhost:8000/",
+            "  curl http://localhost:8000/users",
+            "  curl http://localhost:8000/users/1",
+            "  curl http://localhost:8000/blog/hello-world",
+            "  curl http://localhost:8000/files/documents/readme.txt",
+            "  curl http://localhost:8000/api/v1/health",
+            "",
+            "=" * 50,
+        ]
+        # Single write instead of one print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    print("\nExample requests to try:")
-    print("  curl http://localhost:8000/")
-    print("  curl http://localhost:8000/users")
-    print("  curl http://localhost:8000/users/1")
-    print("  curl http://localhost:8000/blog/hello-world")
-    print("  curl http://localhost:8000/files/documents/readme.txt")
-    print("  curl http://localhost:8000/api/v1/health")
-    print("\n" + "=" * 50)
     # Start the server
     uvicorn.run(
-        "main:app", host="0.0.0.0", port=8000, reload=True, reload_dirs=["routes"]
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        reload_dirs=["routes"],
+        # "auto" picks uvloop and httptools when installed, asyncio/h11 otherwise
+        loop="auto",
+        http="auto",
+        access_log=False,
     )
 
 
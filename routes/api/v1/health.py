@@ -1,12 +1,29 @@
+import time
 from datetime import datetime
 
+import orjson
+from fastapi import Response
 
-def get():
+# (second, body) of the last rendered payload; rebuilt at most once per second
+_cached_body = (-1, b"")
+
+
+async def get():
     """API health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat(),
-        "uptime": "24h 30m 15s",
-        "service": "File-Based Router Demo API",
-    }
+    global _cached_body
+    now = time.time()
+    second = int(now)
+    if _cached_body[0] != second:
+        _cached_body = (
+            second,
+            orjson.dumps(
+                {
+                    "status": "healthy",
+                    "version": "1.0.0",
+                    "timestamp": datetime.fromtimestamp(now).isoformat(),
+                    "uptime": "24h 30m 15s",
+                    "service": "File-Based Router Demo API",
+                }
+            ),
+        )
+    return Response(content=_cached_body[1], media_type="application/json")
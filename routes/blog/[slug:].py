@@ -1,48 +1,73 @@
+import re
+
+import orjson
+from fastapi import HTTPException, Response
+
+# Compiled once at import; fullmatch runs entirely in C
+_SLUG_OK = re.compile(r"[a-z0-9-]{1,64}").fullmatch
+
 blog_posts = {
     "hello-world": {
         "title": "Hello World",
         "content": "This is my first blog post!",
         "author": "Alice",
-        "tags": ["introduction", "hello"],
+        "tags": ("introduction", "hello"),
     },
     "python-tips": {
         "title": "10 Python Tips",
         "content": "Here are 10 useful Python tips for beginners...",
         "author": "Bob",
-        "tags": ["python", "programming", "tips"],
+        "tags": ("python", "programming", "tips"),
     },
     "fastapi-guide": {
         "title": "FastAPI Getting Started",
         "content": "Learn how to build APIs with FastAPI...",
         "author": "Charlie",
-        "tags": ["fastapi", "api", "python"],
+        "tags": ("fastapi", "api", "python"),
     },
 }
 
 
-def get(slug: str):
-    """Get blog post by slug."""
-    from fastapi import HTTPException
+# Serialized GET bodies per slug; entries are dropped when a post changes
+_cached = {
+    slug: orjson.dumps({"slug": slug, "post": post})
+    for slug, post in blog_posts.items()
+}
 
-    post = blog_posts.get(slug)
-    if not post:
-        raise HTTPException(status_code=404, detail="Blog post not found")
 
-    return {"slug": slug, "post": post}
+async def get(slug: str):
+    """Get blog post by slug."""
+    body = _cached.get(slug)
+    if body is None:
+        # Cached slugs are known to be valid, so only misses are checked
+        if not _SLUG_OK(slug):
+            raise HTTPException(status_code=400, detail="Invalid slug")
+        post = blog_posts.get(slug)
+        if not post:
+            raise HTTPException(status_code=404, detail="Blog post not found")
+        body = _cached[slug] = orjson.dumps({"slug": slug, "post": post})
+
+    return Response(content=body, media_type="application/json")
 
 
-def put(slug: str):
+async def put(slug: str):
     """Update blog post by slug."""
-    if slug not in blog_posts:
+    if not _SLUG_OK(slug):
+        raise HTTPException(status_code=400, detail="Invalid slug")
+
+    post = blog_posts.get(slug)
+    if post is None:
         # Create new post
-        blog_posts[slug] = {
+        blog_posts[slug] = post = {
             "title": f"New Post: {slug.replace('-', ' ').title()}",
             "content": "This is a new blog post!",
             "author": "Anonymous",
-            "tags": ["new"],
+            "tags": ("new",),
         }
-        return {"message": "Blog post created", "slug": slug, "post": blog_posts[slug]}
+        _cached.pop(slug, None)
+        return {"message": "Blog post created", "slug": slug, "post": post}
     else:
         # Update existing post
-        blog_posts[slug]["content"] = "This post has been updated!"
-        return {"message": "Blog post updated", "slug": slug, "post": blog_posts[slug]}
+        post["content"] = "This post has been updated!"
+        _cached.pop(slug, None)
+        return {"message": "Blog post updated", "slug": slug, "post": post}
@@ -1,4 +1,7 @@
-def get(path: str):
+from orjson_response import ORJSONResponse
+
+
+async def get(path: str):
     """Serve files from the virtual file system (catch-all route)."""
 
     # # Simulate a file system
@@ -21,14 +24,18 @@ def get(path: str):
     # file_name = segments[-1]
     # directory = "/".join(segments[:-1]) if len(segments) > 1 else ""
 
-    return {"path": path}
+    return ORJSONResponse({"path": path})
 
 
-def post(path: str):
+async def post(path: str):
     """Create a new file (simulated)."""
-    return {"message": f"File created at {path}", "path": path, "action": "create"}
+    return ORJSONResponse(
+        {"message": f"File created at {path}", "path": path, "action": "create"}
+    )
 
 
-def delete(path: str):
+async def delete(path: str):
     """Delete a file (simulated)."""
-    return {"message": f"File deleted at {path}", "path": path, "action": "delete"}
+    return ORJSONResponse(
+        {"message": f"File deleted at {path}", "path": path, "action": "delete"}
+    )
@@ -1,14 +1,22 @@
-def get():
+import orjson
+from fastapi import Response
+
+_ROUTES = (
+    "GET / - This page",
+    "GET /users - List users",
+    "GET /users/{id} - Get user by ID",
+    "POST /users - Create user",
+    "GET /blog/{slug} - Get blog post by slug",
+    "GET /files/{path} - Get file at path (catch-all)",
+    "GET /api/v1/health - Health check",
+)
+
+# The welcome payload never changes, so it is serialized once at import
+_BODY = orjson.dumps(
+    {"message": "Welcome to the File-Based Router Demo!", "routes": _ROUTES}
+)
+
+
+async def get():
     """Home page endpoint."""
-    return {
-        "message": "Welcome to the File-Based Router Demo!",
-        "routes": [
-            "GET / - This page",
-            "GET /users - List users",
-            "GET /users/{id} - Get user by ID",
-            "POST /users - Create user",
-            "GET /blog/{slug} - Get blog post by slug",
-            "GET /files/{path} - Get file at path (catch-all)",
-            "GET /api/v1/health - Health check",
-        ],
-    }
+    return Response(content=_BODY, media_type="application/json")
@@ -1,7 +1,9 @@
 from fastapi import Body, Query, Header, Request
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
-import json
+import orjson
+
+from orjson_response import ORJSONResponse
 
 
 # Pydantic models
@@ -17,7 +19,7 @@ class CommentData(BaseModel):
     message: str
 
 
-def get(
+async def get(
     # Query parameters
     limit: int = Query(10, description="Number of posts to return"),
     offset: int = Query(0, description="Number of posts to skip"),
@@ -37,14 +39,16 @@ def get(
     # Apply pagination
     posts = posts[offset : offset + limit]
 
-    return {
-        "posts": posts,
-        "pagination": {"limit": limit, "offset": offset},
-        "filters": {"published_only": published_only},
-    }
+    return ORJSONResponse(
+        {
+            "posts": posts,
+            "pagination": {"limit": limit, "offset": offset},
+            "filters": {"published_only": published_only},
+        }
+    )
 
 
-def post(
+async def post(
     # Request body (JSON)
     post_data: PostData,
     # Headers
@@ -67,47 +71,49 @@ def post(
         },
     }
 
-    return {"message": "Post created", "post": new_post}
+    return ORJSONResponse({"message": "Post created", "post": new_post})
 
 
-def put(
+async def put(
     # Multiple request body types
     post_data: PostData = Body(...),
     comments: list[CommentData] = Body([]),
     metadata: Dict[str, Any] = Body({}),
 ):
     """Update post with multiple body parts."""
-    return {
-        "message": "Post updated with multiple body parts",
-        "post": post_data.dict(),
-        "comments": [c.dict() for c in comments],
-        "metadata": metadata,
-    }
+    return ORJSONResponse(
+        {
+            "message": "Post updated with multiple body parts",
+            # Models are dumped by ORJSONResponse while encoding
+            "post": post_data,
+            "comments": comments,
+            "metadata": metadata,
+        }
+    )
 
 
 async def patch(request: Request):
     """Handle raw request for custom processing."""
-    # Get raw body
-    body = await request.body()
-
-    # Get headers
-    headers = dict(request.headers)
-
-    # Get query params
-    query_params = dict(request.query_params)
+    # Read the raw body from the stream into a single buffer
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
 
     # Parse JSON if present
     try:
-        json_data = json.loads(body) if body else {}
-    except json.JSONDecodeError:
+        json_data = orjson.loads(body) if body else {}
+    except orjson.JSONDecodeError:
         json_data = {"error": "Invalid JSON"}
 
-    return {
-        "message": "Raw request processed",
-        "body_size": len(body),
-        "headers_count": len(headers),
-        "query_params": query_params,
-        "json_data": json_data,
-        "method": request.method,
-        "url": str(request.url),
-    }
+    return ORJSONResponse(
+        {
+            "message": "Raw request processed",
+            "body_size": len(body),
+            # Unique header names, as before, without copying values into a dict
+            "headers_count": len(set(request.headers.keys())),
+            "query_params": dict(request.query_params),
+            "json_data": json_data,
+            "method": request.method,
+            "url": str(request.url),
+        }
+    )
@@ -2,6 +2,8 @@ from fastapi import HTTPException
 from pydantic import BaseModel
 from typing import Optional
 
+from orjson_response import ORJSONResponse
+
 
 # Pydantic models for request/response bodies
 class UserCreate(BaseModel):
@@ -14,24 +16,24 @@ class UserUpdate(BaseModel):
     email: Optional[str] = None
 
 
-users_db = [
-    {"id": 1, "name": "Alice", "email": "alice@example.com"},
-    {"id": 2, "name": "Bob", "email": "bob@example.com"},
-    {"id": 3, "name": "Charlie", "email": "charlie@example.com"},
-]
+users_db: dict[int, dict] = {
+    1: {"id": 1, "name": "Alice", "email": "alice@example.com"},
+    2: {"id": 2, "name": "Bob", "email": "bob@example.com"},
+    3: {"id": 3, "name": "Charlie", "email": "charlie@example.com"},
+}
 
 
-def get(id: int):
+async def get(id: int):
     """Get user by ID."""
-    user = next((u for u in users_db if u["id"] == id), None)
+    user = users_db.get(id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return {"user": user}
+    return ORJSONResponse({"user": user})
 
 
-def put(id: int, user_data: UserUpdate):
+async def put(id: int, user_data: UserUpdate):
     """Update user by ID with request body."""
-    user = next((u for u in users_db if u["id"] == id), None)
+    user = users_db.get(id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -41,15 +43,13 @@ def put(id: int, user_data: UserUpdate):
     if user_data.email is not None:
         user["email"] = user_data.email
 
-    return {"message": "User updated", "user": user}
+    return ORJSONResponse({"message": "User updated", "user": user})
 
 
-def delete(id: int):
+async def delete(id: int):
     """Delete user by ID."""
-    global users_db
-    user = next((u for u in users_db if u["id"] == id), None)
+    user = users_db.pop(id, None)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    users_db = [u for u in users_db if u["id"] != id]
-    return {"message": "User deleted", "user": user}
+    return ORJSONResponse({"message": "User deleted", "user": user})
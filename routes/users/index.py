@@ -1,6 +1,9 @@
+import itertools
 from pydantic import BaseModel
 from typing import Optional
 
+from orjson_response import ORJSONResponse
+
 
 # Pydantic models for request bodies
 class UserCreate(BaseModel):
@@ -13,25 +16,28 @@ class UserUpdate(BaseModel):
     email: Optional[str] = None
 
 
-users_db = [
-    {"id": 1, "name": "Alice", "email": "alice@example.com"},
-    {"id": 2, "name": "Bob", "email": "bob@example.com"},
-    {"id": 3, "name": "Charlie", "email": "charlie@example.com"},
-]
+users_db: dict[int, dict] = {
+    1: {"id": 1, "name": "Alice", "email": "alice@example.com"},
+    2: {"id": 2, "name": "Bob", "email": "bob@example.com"},
+    3: {"id": 3, "name": "Charlie", "email": "charlie@example.com"},
+}
+
+# Monotonic id source, seeded past the highest existing id
+_next_id = itertools.count(max(users_db, default=0) + 1)
 
 
-def getty():
+async def get():
     """Get all users."""
-    return {"users": users_db}
+    return ORJSONResponse({"users": list(users_db.values())})
 
 
-def post(user_data: UserCreate):
+async def post(user_data: UserCreate):
     """Create a new user with request body."""
     # Generate new ID
-    new_id = max([u["id"] for u in users_db], default=0) + 1
+    new_id = next(_next_id)
 
     # Create new user from request body
     new_user = {"id": new_id, "name": user_data.name, "email": user_data.email}
 
-    users_db.append(new_user)
-    return {"message": "User created", "user": new_user}
+    users_db[new_id] = new_user
+    return ORJSONResponse({"message": "User created", "user": new_user})
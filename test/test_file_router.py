@@ -1,5 +1,6 @@
 import pytest
 import tempfile
+import warnings
 import shutil
 from pathlib import Path
 from fastapi.testclient import TestClient
@@ -63,41 +64,79 @@ class TestFileBasedRouter:
         router = FileBasedRouter(str(self.routes_dir))
 
         # Index route
-        file_path = self.routes_dir / "index.py"
-        pattern, params = router._convert_file_path_to_route(file_path)
+        pattern, params = router._convert_file_path_to_route("index.py")
         assert pattern == "/"
         assert params == {}
 
         # Simple nested route
-        file_path = self.routes_dir / "users" / "index.py"
-        pattern, params = router._convert_file_path_to_route(file_path)
+        pattern, params = router._convert_file_path_to_route("users/index.py")
         assert pattern == "/users"
         assert params == {}
 
         # Dynamic route with id
-        file_path = self.routes_dir / "users" / "[id].py"
-        pattern, params = router._convert_file_path_to_route(file_path)
+        pattern, params = router._convert_file_path_to_route("users/[id].py")
         assert pattern == "/users/{id}"
         assert params == {"id": {"type": "str", "is_catch_all": False}}
 
         # Dynamic route with typed parameter
-        file_path = self.routes_dir / "posts" / "[id:int].py"
-        pattern, params = router._convert_file_path_to_route(file_path)
+        pattern, params = router._convert_file_path_to_route("posts/[id:int].py")
         assert pattern == "/posts/{id:int}"
         assert params == {"id": {"type": "int", "is_catch_all": False}}
 
         # Slug route
-        file_path = self.routes_dir / "blog" / "[slug:].py"
-        pattern, params = router._convert_file_path_to_route(file_path)
+        pattern, params = router._convert_file_path_to_route("blog/[slug:].py")
         assert pattern == "/blog/{slug}"
         assert params == {"slug": {"type": "str", "is_catch_all": False}}
 
         # Catch-all route
-        file_path = self.routes_dir / "files" / "[...path].py"
-        pattern, params = router._convert_file_path_to_route(file_path)
+        pattern, params = router._convert_file_path_to_route("files/[...path].py")
         assert pattern == "/files/{path:path}"
         assert params == {"path": {"type": "str", "is_catch_all": True}}
 
+    def test_route_cache_tracks_current_files(self):
+        """Test that re-scans reuse the route cache and drop removed files."""
+        self.create_route_file(
+            "users/[id].py",
+            """
+def get(id):
+    return {}
+""",
+        )
+        removed = self.create_route_file(
+            "old.py",
+            """
+def get():
+    return {}
+""",
+        )
+        broken = self.create_route_file(
+            "broken.py",
+            """
+def get():
+    return {}
+""",
+        )
+
+        router = FileBasedRouter(str(self.routes_dir))
+        router.scan_routes()
+        cached = router._route_cache["users/[id].py"]
+        assert set(router._route_cache) == {"users/[id].py", "old.py", "broken.py"}
+        patterns = {route["pattern"] for route in router.get_routes()}
+        assert patterns == {"/users/{id}", "/old", "/broken"}
+
+        removed.unlink()
+        broken.write_text("def get(:\n")
+        router.scan_routes()
+        assert set(router._route_cache) == {"users/[id].py", "broken.py"}
+        assert router._route_cache["users/[id].py"] is cached
+        patterns = {route["pattern"] for route in router.get_routes()}
+        assert patterns == {"/users/{id}"}
+
+        client = TestClient(router.get_app())
+        assert client.get("/users/1").status_code == 200
+        assert client.get("/old").status_code == 404
+        assert client.get("/broken").status_code == 404
+
     def test_basic_route_registration(self):
         """Test basic route registration and handling."""
         # Create a simple route file
@@ -301,6 +340,70 @@ def get(user_id, post_id):
             "post_id_type": "int",
         }
 
+    def test_handlers_registered_without_wrapper(self):
+        """Test that handlers needing no signature rewrite are not wrapped."""
+        router = FileBasedRouter(str(self.routes_dir))
+        params = {"id": {"type": "int", "is_catch_all": False}}
+
+        def index():
+            return {}
+
+        def get(id: int):
+            return {"user_id": id}
+
+        def post(q: str, id: int):
+            return {"user_id": id, "q": q}
+
+        def put(id):
+            return {"updated_user": id}
+
+        assert router._create_route_wrapper(index, {}) is index
+        assert router._create_route_wrapper(get, params) is get
+        assert router._create_route_wrapper(post, params) is post
+        assert router._create_route_wrapper(put, params) is not put
+
+    def test_typed_param_without_annotation(self):
+        """Test that un-annotated path params still get the route's type."""
+        self.create_route_file(
+            "users/[id:int].py",
+            """
+def put(id):
+    return {"updated_user": id}
+""",
+        )
+
+        router = FileBasedRouter(str(self.routes_dir))
+        router.scan_routes()
+
+        client = TestClient(router.get_app())
+        response = client.put("/users/7")
+        assert response.status_code == 200
+        assert response.json() == {"updated_user": 7}
+
+    def test_invalid_param_name_skipped(self):
+        """Test that a param name that is not an identifier skips only that file."""
+        self.create_route_file(
+            "users/[user-id].py",
+            """
+def get(user_id):
+    return {"user_id": user_id}
+""",
+        )
+        self.create_route_file(
+            "index.py",
+            """
+def get():
+    return {"ok": True}
+""",
+        )
+
+        router = FileBasedRouter(str(self.routes_dir))
+        router.scan_routes()
+
+        assert [route["pattern"] for route in router.get_routes()] == ["/"]
+        client = TestClient(router.get_app())
+        assert client.get("/").json() == {"ok": True}
+
     def test_route_info_retrieval(self):
         """Test getting information about registered routes."""
         self.create_route_file(
@@ -334,6 +437,104 @@ def post(id):
         assert "POST" in dynamic_route["methods"]
         assert dynamic_route["params"]["id"]["type"] == "str"
 
+    def test_route_info_is_read_only(self):
+        """Test that route info cannot be mutated through get_routes()."""
+        self.create_route_file(
+            "users/[id].py",
+            """
+def get(id):
+    return {}
+""",
+        )
+
+        router = FileBasedRouter(str(self.routes_dir))
+        router.scan_routes()
+
+        route = router.get_routes()[0]
+        with pytest.raises(TypeError):
+            route["params"]["x"] = 1
+        with pytest.raises(TypeError):
+            route["params"]["id"]["type"] = "int"
+        assert isinstance(route["methods"], tuple)
+
+        # Re-scanning still sees the original, cached params
+        router.scan_routes()
+        assert router.get_routes()[0]["params"] == {
+            "id": {"type": "str", "is_catch_all": False}
+        }
+
+    def test_custom_tags(self):
+        """Test directory-level and file-level custom tag overrides."""
+        self.create_route_file(
+            "api/v1/health.py",
+            """
+def get():
+    return {}
+""",
+        )
+
+        self.create_route_file(
+            "api/v1/status.py",
+            """
+def get():
+    return {}
+""",
+        )
+
+        self.create_route_file(
+            "users/index.py",
+            """
+def get():
+    return {}
+""",
+        )
+
+        router = FileBasedRouter(str(self.routes_dir))
+        router.set_custom_tag(str(self.routes_dir / "api"), "api-root")
+        health_file = self.routes_dir / "api" / "v1" / "health.py"
+        router.set_custom_tag(str(health_file), "health")
+        router.scan_routes()
+
+        tags = {r["pattern"]: r["tag"] for r in router.get_routes()}
+        assert tags == {
+            "/api/v1/health": "health",
+            "/api/v1/status": "api-root",
+            "/users": "users",
+        }
+
+    def test_rescan_before_get_app(self):
+        """Test that re-scanning before the app is built does not duplicate routes."""
+        self.create_route_file(
+            "users/index.py",
+            """
+def get():
+    return {"users": []}
+""",
+        )
+
+        self.create_route_file(
+            "users/[id].py",
+            """
+def get(id):
+    return {"user_id": id}
+""",
+        )
+
+        router = FileBasedRouter(str(self.routes_dir))
+        router.scan_routes()
+        router.set_custom_tag(str(self.routes_dir / "users"), "user-management")
+        router.scan_routes()
+
+        patterns = sorted(r["pattern"] for r in router.get_routes())
+        assert patterns == ["/users", "/users/{id}"]
+
+        # Duplicate routes would emit a "Duplicate Operation ID" warning
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            schema = router.get_app().openapi()
+        assert schema["paths"]["/users"]["get"]["tags"] == ["user-management"]
+        assert schema["paths"]["/users/{id}"]["get"]["tags"] == ["user-management"]
+
     def test_invalid_route_handling(self):
         """Test handling of invalid route files."""
         # Create a file with syntax error
@@ -364,6 +565,50 @@ some_variable = "test"
             for r in routes
         )
 
+    def test_private_files_skipped(self):
+        """Test that files and directories starting with '_' or '.' are ignored."""
+        self.create_route_file(
+            "users/index.py",
+            """
+def get():
+    return {"users": []}
+""",
+        )
+
+        for path in ("_helpers.py", "users/_private/index.py", ".hidden/index.py"):
+            self.create_route_file(
+                path,
+                """
+def get():
+    return {}
+""",
+            )
+
+        router = FileBasedRouter(str(self.routes_dir))
+        router.scan_routes()
+
+        routes = router.get_routes()
+        assert [r["pattern"] for r in routes] == ["/users"]
+
+    def test_symlink_loop_ignored(self):
+        """Test that a symlinked directory loop does not break scanning."""
+        self.create_route_file(
+            "users/index.py",
+            """
+def get():
+    return {"users": []}
+""",
+        )
+        (self.routes_dir / "users" / "loop").symlink_to(
+            self.routes_dir, target_is_directory=True
+        )
+
+        router = FileBasedRouter(str(self.routes_dir))
+        router.scan_routes()
+
+        routes = router.get_routes()
+        assert [r["pattern"] for r in routes] == ["/users"]
+
     def test_file_router_function(self):
         """Test the convenience function for creating routers."""
         self.create_route_file(
@@ -0,0 +1,42 @@
+import importlib
+
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+
+
+def test_large_responses_are_gzipped():
+    """Responses over 500 bytes are gzip-compressed by the module-level app."""
+    client = TestClient(app)
+
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert len(response.content) > 500
+    assert response.headers["content-encoding"] == "gzip"
+
+    # Small payloads stay uncompressed
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_cors_is_opt_in(monkeypatch):
+    """CORS headers are only sent when ENABLE_CORS=1 at import time."""
+    preflight_headers = {
+        "Origin": "http://example.com",
+        "Access-Control-Request-Method": "GET",
+    }
+
+    response = TestClient(app).options("/", headers=preflight_headers)
+    assert "access-control-allow-origin" not in response.headers
+
+    monkeypatch.setenv("ENABLE_CORS", "1")
+    cors_main = importlib.reload(main)
+    try:
+        response = TestClient(cors_main.app).options("/", headers=preflight_headers)
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://example.com"
+    finally:
+        monkeypatch.delenv("ENABLE_CORS")
+        importlib.reload(main)
@@ -0,0 +1,53 @@
+import pytest
+from fastapi.testclient import TestClient
+from file_router import file_router
+
+
+@pytest.fixture
+def client():
+    """Client for the demo routes; each router loads fresh route modules."""
+    return TestClient(file_router("routes").get_app())
+
+
+def test_list_users(client):
+    """GET /users is served by routes/users/index.py:get."""
+    response = client.get("/users")
+    assert response.status_code == 200
+    users = response.json()["users"]
+    assert len(users) == 3
+    assert [u["id"] for u in users] == [1, 2, 3]
+
+
+def test_invalid_blog_slug_rejected(client):
+    """Slugs outside [a-z0-9-]{1,64} get a 400 on GET and PUT."""
+    for slug in ("Bad_Slug", "a" * 65):
+        assert client.get(f"/blog/{slug}").status_code == 400
+        assert client.put(f"/blog/{slug}").status_code == 400
+
+
+def test_unknown_blog_slug_not_found(client):
+    """A valid slug with no post still gets a 404."""
+    response = client.get("/blog/no-such-post")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Blog post not found"}
+
+
+def test_blog_put_invalidates_cached_body(client):
+    """A PUT drops the cached GET body so the update is served."""
+    response = client.get("/blog/hello-world")
+    assert response.json()["post"]["content"] == "This is my first blog post!"
+
+    response = client.put("/blog/hello-world")
+    assert response.json()["message"] == "Blog post updated"
+
+    response = client.get("/blog/hello-world")
+    assert response.status_code == 200
+    assert response.json()["post"]["content"] == "This post has been updated!"
+
+
+def test_patch_counts_unique_headers(client):
+    """Repeated headers are counted once in headers_count."""
+    response = client.patch("/posts", headers=[("x-tag", "a"), ("x-tag", "b")])
+    single = client.patch("/posts", headers=[("x-tag", "a")])
+    assert response.status_code == 200
+    assert response.json()["headers_count"] == single.json()["headers_count"]